@@ -1,13 +1,13 @@
 """The Fingrid Easy Setup integration."""
 import logging
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import SOURCE_IGNORE, ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import CONF_API_KEY, Platform
-from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN
 from .coordinator import FingridDataUpdateCoordinator
+from .helpers import api_key_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,26 +18,32 @@ PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Fingrid Easy Setup from a config entry."""
+    # Home Assistant normally never sets up these entries, but make sure a disabled
+    # or ignored entry doesn't create a coordinator or fire any API requests.
+    if entry.disabled_by is not None or entry.source == SOURCE_IGNORE:
+        _LOGGER.debug("Skipping setup of disabled or ignored config entry %s", entry.entry_id)
+        return False
+
     _LOGGER.debug("Setting up Fingrid Easy Setup for config entry %s", entry.entry_id)
 
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
 
-    # api_key = entry.data[CONF_API_KEY] # No longer needed here, coordinator handles it
-
     coordinator = FingridDataUpdateCoordinator(hass=hass, entry=entry)
 
-    # Perform the first data refresh. If this fails (e.g., bad API key,
-    # network issues), Home Assistant will automatically retry setup later.
-    # ConfigEntryNotReady will be raised by coordinator's first refresh if critical.
-    await coordinator.async_config_entry_first_refresh()
-    
     # Store the coordinator in hass.data for platforms to access.
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Forward the setup to platforms.
+    # Forward the setup to platforms first so sensors are listening when data arrives.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Perform the first data refresh in the background so Fingrid doesn't hold up
+    # Home Assistant startup; sensors stay unavailable until it completes. Failures
+    # are handled like any scheduled update (an auth error starts re-auth).
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN}_first_refresh_{entry.entry_id}"
+    )
+
     # Add listener for options updates
     entry.async_on_unload(entry.add_update_listener(async_options_update_listener))
 
@@ -45,6 +51,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry to the current version."""
+    _LOGGER.debug(
+        "Migrating config entry %s from version %s.%s",
+        entry.entry_id,
+        entry.version,
+        entry.minor_version,
+    )
+
+    if entry.version > 1:
+        # Downgraded from a future version we don't know how to handle
+        return False
+
+    if entry.minor_version < 2:
+        # Entries created before unique IDs were hashed still use the raw API key
+        unique_id = entry.unique_id
+        if unique_id is not None and unique_id == entry.data.get(CONF_API_KEY):
+            unique_id = api_key_unique_id(unique_id)
+        hass.config_entries.async_update_entry(entry, unique_id=unique_id, minor_version=2)
+
+    _LOGGER.info(
+        "Migrated config entry %s to version %s.%s",
+        entry.entry_id,
+        entry.version,
+        entry.minor_version,
+    )
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Fingrid Easy Setup for config entry %s", entry.entry_id)
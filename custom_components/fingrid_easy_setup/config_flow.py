@@ -1,6 +1,7 @@
 """Config flow for Fingrid Easy Setup integration."""
 import asyncio
 import logging
+import re
 import voluptuous as vol
 import aiohttp
 
@@ -20,6 +21,8 @@ from .const import (
     DATASET_ID_POWER_SYSTEM_STATE,
     CONF_API_KEY,
 )
+from .coordinator import VALIDATE_TIMEOUT
+from .helpers import api_key_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,28 +30,66 @@ DATA_SCHEMA = vol.Schema({
     vol.Required(CONF_API_KEY): str,
 })
 
+# Fingrid API keys only contain these characters; anything else is a typo
+_API_KEY_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+MIN_API_KEY_LENGTH = 16
+
+# Static parts of the options schema, only the defaults change per form render
+_SENSOR_OPTIONS = [
+    {"value": dataset_id, "label": name}
+    for dataset_id, name in AVAILABLE_SENSORS_DATA.items()
+]
+_SENSOR_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=_SENSOR_OPTIONS,
+        multiple=True,
+        mode=selector.SelectSelectorMode.LIST, # Show as a list
+        # custom_value=False, # Not allowing custom values
+        # sort=True, # Optionally sort options by label
+    )
+)
+_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_UPDATE_INTERVAL_MINUTES, max=MAX_UPDATE_INTERVAL_MINUTES),
+)
+
+
 class FingridEasySetupConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Fingrid Easy Setup."""
 
     VERSION = 1
+    # 1.2: unique_id is a hash of the API key instead of the key itself
+    MINOR_VERSION = 2
 
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         errors = {}
         if user_input is not None:
             api_key = user_input[CONF_API_KEY]
+            # Reject obviously malformed keys without spending an API request on them
+            if len(api_key) < MIN_API_KEY_LENGTH or not _API_KEY_PATTERN.fullmatch(api_key):
+                errors["base"] = "invalid_api_key"
+                return self.async_show_form(
+                    step_id="user", data_schema=DATA_SCHEMA, errors=errors
+                )
+
             session = async_get_clientsession(self.hass)
             headers = {"x-api-key": api_key, "Accept": "application/json"}
             # Using dataset 209 for validation as per blueprint
             url = "https://data.fingrid.fi/api/datasets/209/data?pageSize=1"
 
             try:
-                async with session.get(url, headers=headers, timeout=10) as response:
+                async with session.get(url, headers=headers, timeout=VALIDATE_TIMEOUT) as response:
                     if response.status == 200:
                         # Optionally, try to parse JSON to be more certain
                         # await response.json()
-                        await self.async_set_unique_id(api_key) # Using API key as unique_id
+                        # Use a hash of the API key so the key isn't stored as the unique_id
+                        await self.async_set_unique_id(api_key_unique_id(api_key))
                         self._abort_if_unique_id_configured()
+                        # Entries not migrated yet (e.g. disabled ones) still hold the raw key
+                        for entry in self._async_current_entries(include_ignore=False):
+                            if entry.data.get(CONF_API_KEY) == api_key:
+                                return self.async_abort(reason="already_configured")
                         return self.async_create_entry(title="Fingrid", data=user_input)
                     elif response.status in [401, 403]:
                         errors["base"] = "invalid_api_key"
@@ -57,7 +98,7 @@ class FingridEasySetupConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         _LOGGER.error(
                             "API validation failed with status %s: %s",
                             response.status,
-                            await response.text()
+                            (await response.content.read(256)).decode("utf-8", errors="replace"),
                         )
                         errors["base"] = "cannot_connect" # Or a more specific error
             except (aiohttp.ClientError, asyncio.TimeoutError):
@@ -110,25 +151,11 @@ class FingridOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Optional(
                     CONF_ENABLED_SENSORS,
                     default=current_enabled_sensors,
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": dataset_id, "label": name}
-                            for dataset_id, name in AVAILABLE_SENSORS_DATA.items()
-                        ],
-                        multiple=True,
-                        mode=selector.SelectSelectorMode.LIST, # Show as a list
-                        # custom_value=False, # Not allowing custom values
-                        # sort=True, # Optionally sort options by label
-                    )
-                ),
+                ): _SENSOR_SELECTOR,
                 vol.Required(
                     CONF_UPDATE_INTERVAL,
                     default=current_update_interval,
-                ): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=MIN_UPDATE_INTERVAL_MINUTES, max=MAX_UPDATE_INTERVAL_MINUTES),
-                ),
+                ): _INTERVAL_VALIDATOR,
             }
         )
 
@@ -3,6 +3,9 @@ from datetime import timedelta
 
 DOMAIN = "fingrid_easy_setup"
 
+# Fingrid API endpoint returning data for several datasets in one response
+FINGRID_MULTI_DATASET_URL = "https://data.fingrid.fi/api/data"
+
 # Fingrid API Dataset IDs
 DATASET_ID_POWER_SYSTEM_STATE = "209"
 DATASET_ID_GRID_FREQUENCY = "177"
@@ -29,6 +32,13 @@ DEFAULT_UPDATE_INTERVAL = timedelta(minutes=DEFAULT_UPDATE_INTERVAL_MINUTES)
 MIN_UPDATE_INTERVAL_MINUTES = 1
 MAX_UPDATE_INTERVAL_MINUTES = 60
 
+# Maximum number of concurrent requests to the Fingrid API per config entry
+MAX_CONCURRENT_REQUESTS = 3
+
+# Fingrid allows 10 requests per minute, keep one request of headroom
+API_RATE_LIMIT_REQUESTS = 9
+API_RATE_LIMIT_PERIOD_SECONDS = 60
+
 # Map dataset IDs to their default names for use in Options Flow
 AVAILABLE_SENSORS_DATA = {
     DATASET_ID_POWER_SYSTEM_STATE: SENSOR_NAME_POWER_SYSTEM_STATE,
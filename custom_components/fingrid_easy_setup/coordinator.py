@@ -1,31 +1,139 @@
 """DataUpdateCoordinator for the Fingrid Easy Setup integration."""
 import asyncio
 import logging
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
+from typing import Any
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry # Add this
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
+    API_RATE_LIMIT_PERIOD_SECONDS,
+    API_RATE_LIMIT_REQUESTS,
     CONF_API_KEY, # Added for clarity, used in __init__
     CONF_ENABLED_SENSORS,
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
     DATASET_ID_POWER_SYSTEM_STATE,
+    FINGRID_MULTI_DATASET_URL,
+    MAX_CONCURRENT_REQUESTS,
 )
 from .exceptions import (
+    FingridApiClientError,
     FingridApiAuthError,
     FingridApiRateLimitError,
     FingridApiError,
+    FingridApiTimeoutError,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fail fast on connection stalls instead of spending the whole budget on connecting
+API_TIMEOUT = aiohttp.ClientTimeout(total=20, sock_connect=5, sock_read=10)
+VALIDATE_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=3, sock_read=5)
+# The specific socket timeout errors only exist in aiohttp 3.10 and later;
+# on older versions every timeout is reported as "total".
+_CONNECT_TIMEOUT_ERRORS = getattr(aiohttp, "ConnectionTimeoutError", ())
+_READ_TIMEOUT_ERRORS = getattr(aiohttp, "SocketTimeoutError", ())
+
+# Parameters to get the latest value of a single dataset, may need adjustment
+# based on API specifics (e.g. sorting by endTime desc or startTime/endTime windows).
+_LATEST_ENTRY_PARAMS = {"pageSize": 1}
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+@lru_cache(maxsize=64)
+def _minutes_to_timedelta(minutes: int) -> timedelta:
+    """Return a shared timedelta for an update interval in minutes."""
+    return timedelta(minutes=minutes)
+
+
+class _RateLimiter:
+    """Sliding window limiter keeping requests within the Fingrid API budget."""
+
+    def __init__(self, max_rate: int, time_period: float) -> None:
+        """Allow at most max_rate requests per time_period seconds."""
+        self._max_rate = max_rate
+        self._time_period = time_period
+        self._timestamps: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> None:
+        """Wait until a request fits in the budget, then record it."""
+        async with self._lock:
+            now = time.monotonic()
+            while self._timestamps and now - self._timestamps[0] >= self._time_period:
+                self._timestamps.popleft()
+            if len(self._timestamps) >= self._max_rate:
+                # Only throttle when the budget is actually used up
+                await asyncio.sleep(self._time_period - (now - self._timestamps[0]))
+                self._timestamps.popleft()
+            self._timestamps.append(time.monotonic())
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Nothing to release, requests are counted when they start."""
+
+
+@dataclass
+class _CircuitBreaker:
+    """Short-circuit Fingrid API calls after repeated failures."""
+
+    failure_threshold: int = 5
+    reset_timeout: float = 120  # seconds
+    failure_count: int = 0
+    opened_at: float = 0.0
+    state: str = CIRCUIT_CLOSED
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent to the API."""
+        if self.state == CIRCUIT_CLOSED:
+            return True
+        if self.state == CIRCUIT_OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            # Reset timeout elapsed, let a single probe request through
+            self.state = CIRCUIT_HALF_OPEN
+            self.opened_at = time.monotonic()
+            return True
+        # Half-open: a probe request is already in flight, unless it never reported
+        # back within the reset timeout, in which case another probe is allowed
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return False
+        self.opened_at = time.monotonic()
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.failure_count = 0
+        self.state = CIRCUIT_CLOSED
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit if needed."""
+        self.failure_count += 1
+        if self.state == CIRCUIT_HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state != CIRCUIT_OPEN:
+                _LOGGER.warning(
+                    "Fingrid API failed %s times in a row, pausing requests for %s seconds",
+                    self.failure_count,
+                    self.reset_timeout,
+                )
+            self.state = CIRCUIT_OPEN
+            self.opened_at = time.monotonic()
+
 
 class FingridDataUpdateCoordinator(DataUpdateCoordinator):
     """Manages fetching Fingrid data for the integration."""
@@ -36,23 +144,56 @@ class FingridDataUpdateCoordinator(DataUpdateCoordinator):
         self.config_entry = entry # Store the config entry
         self.api_key = entry.data[CONF_API_KEY] # Get API key from entry.data
         self.session = async_get_clientsession(hass)
+        self._headers = {"x-api-key": self.api_key, "Accept": "application/json"}
+        # Cap concurrent requests so a burst stays within Fingrid's 10/minute budget
+        self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._limiter = _RateLimiter(API_RATE_LIMIT_REQUESTS, API_RATE_LIMIT_PERIOD_SECONDS)
+        # Stop calling the API during outages and serve the last known data instead
+        self._breaker = _CircuitBreaker()
+        self._last_good: dict[str, dict] = {}
+        # ETags and decoded bodies per URL, for conditional requests
+        self._etags: dict[str, str] = {}
+        self._cached_responses: dict[str, Any] = {}
+        # Refresh currently running, shared with overlapping refresh requests
+        self._inflight: asyncio.Task[dict[str, dict | None]] | None = None
 
-        # Get enabled sensors from options, default to power system state if not set
-        self.enabled_dataset_ids = entry.options.get(
-            CONF_ENABLED_SENSORS, [DATASET_ID_POWER_SYSTEM_STATE]
+        opts = entry.options
+
+        # Get enabled sensors from options, default to power system state if not set.
+        # Duplicates are dropped (keeping order) so each dataset is fetched and set up once.
+        # IDs are interned as they key the data dict that sensors probe on every update.
+        self.enabled_dataset_ids: tuple[str, ...] = tuple(
+            sys.intern(dataset_id)
+            for dataset_id in dict.fromkeys(
+                opts.get(CONF_ENABLED_SENSORS, (DATASET_ID_POWER_SYSTEM_STATE,))
+            )
         )
+        self._urls = {
+            dataset_id: f"https://data.fingrid.fi/api/datasets/{dataset_id}/data"
+            for dataset_id in self.enabled_dataset_ids
+        }
         
         # Get update interval from options, default to constant
-        update_interval_minutes = entry.options.get(
+        update_interval_minutes = opts.get(
             CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL.seconds // 60
         )
-        resolved_update_interval = timedelta(minutes=update_interval_minutes)
+        resolved_update_interval = _minutes_to_timedelta(update_interval_minutes)
+
+        # Warn once if polling interval is too short for Fingrid API limits.
+        # Changing the interval reloads the entry, which creates a new coordinator.
+        if resolved_update_interval.total_seconds() < 180:
+            _LOGGER.warning(
+                "Polling interval is set to less than 3 minutes. This may cause API rate limiting. "
+                "Increase the update interval in integration options."
+            )
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN} ({entry.entry_id})",
             update_interval=resolved_update_interval,
+            # Only notify listeners when the fetched data actually changed
+            always_update=False,
         )
         _LOGGER.debug(
             "Coordinator initialized with enabled_datasets: %s, update_interval: %s",
@@ -60,112 +201,202 @@ class FingridDataUpdateCoordinator(DataUpdateCoordinator):
             resolved_update_interval
         )
 
-    async def _async_fetch_dataset(self, dataset_id: str) -> dict | None:
-        """Fetch a single dataset from the Fingrid API."""
-        url = f"https://data.fingrid.fi/api/datasets/{dataset_id}/data"
-        headers = {"x-api-key": self.api_key, "Accept": "application/json"}
-        # Parameters to get the latest value, may need adjustment based on API specifics
-        # For many datasets, fetching with pageSize=1 and sorting by endTime desc might be needed
-        # or specific startTime/endTime windows.
-        # For now, a simple pageSize=1 for the latest entry.
-        params = {"pageSize": 1} 
-
-        _LOGGER.debug("Fetching dataset %s from %s", dataset_id, url)
+    async def _async_api_get(self, url: str, params: dict | list, label: str) -> Any:
+        """Issue a GET to the Fingrid API, tracking the outcome in the circuit breaker."""
         try:
-            async with self.session.get(url, headers=headers, params=params, timeout=20) as response:
+            api_response = await self._async_request(url, params, label)
+        except FingridApiAuthError:
+            # The API is reachable, the failure is ours to fix through re-auth
+            self._breaker.record_success()
+            raise
+        except BaseException:
+            # Any other outcome, including cancellation, counts as a failure so a
+            # half-open probe always reports back to the breaker
+            self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        return api_response
+
+    async def _async_request(self, url: str, params: dict | list, label: str) -> Any:
+        """Issue a GET to the Fingrid API and return the decoded JSON body."""
+        headers = self._headers
+        if (etag := self._etags.get(url)) is not None:
+            # Let the API answer 304 Not Modified if the data hasn't changed
+            headers = {**self._headers, "If-None-Match": etag}
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Fetching %s from %s", label, url)
+        try:
+            async with self._fetch_semaphore, self._limiter, self.session.get(
+                url, headers=headers, params=params, timeout=API_TIMEOUT
+            ) as response:
+                if response.status == 304 and url in self._cached_responses:
+                    _LOGGER.debug("%s not modified, reusing cached response", label)
+                    return self._cached_responses[url]
                 if response.status == 200:
-                    api_response = await response.json()
-                    # Expecting a dict with a 'data' key containing a list
-                    if (
-                        isinstance(api_response, dict)
-                        and "data" in api_response
-                        and isinstance(api_response["data"], list)
-                        and len(api_response["data"]) > 0
-                    ):
-                        latest_entry = api_response["data"][0]
-                        _LOGGER.debug("Successfully fetched dataset %s: %s", dataset_id, latest_entry)
-                        return latest_entry
-                    _LOGGER.warning("No data or unexpected format for dataset %s: %s", dataset_id, api_response)
-                    return None
+                    api_response = json_loads(await response.read())
+                    if (etag := response.headers.get("ETag")) is not None:
+                        self._etags[url] = etag
+                        self._cached_responses[url] = api_response
+                    return api_response
                 if response.status in [401, 403]:
-                    _LOGGER.error("Authentication error for dataset %s: %s", dataset_id, response.status)
-                    raise FingridApiAuthError(f"Authentication failed for dataset {dataset_id} (HTTP {response.status})")
+                    _LOGGER.error("Authentication error for %s: %s", label, response.status)
+                    raise FingridApiAuthError(f"Authentication failed for {label} (HTTP {response.status})")
                 if response.status == 429:
-                    _LOGGER.warning("Rate limit hit for dataset %s", dataset_id)
-                    raise FingridApiRateLimitError(f"Rate limit hit for dataset {dataset_id}")
+                    _LOGGER.warning("Rate limit hit for %s", label)
+                    raise FingridApiRateLimitError(f"Rate limit hit for {label}")
                 
-                response_text = await response.text()
+                # Only read the start of the body, error pages can be large HTML documents
+                response_text = (await response.content.read(256)).decode("utf-8", errors="replace")
                 _LOGGER.error(
-                    "Error fetching dataset %s: HTTP %s - %s",
-                    dataset_id,
+                    "Error fetching %s: HTTP %s - %s",
+                    label,
                     response.status,
                     response_text[:150] # Log snippet of error
                 )
-                raise FingridApiError(f"Error fetching dataset {dataset_id}: HTTP {response.status}")
+                raise FingridApiError(f"Error fetching {label}: HTTP {response.status}")
 
+        except FingridApiClientError:
+            raise
+        except asyncio.TimeoutError as err:
+            # aiohttp's socket timeouts are also ClientErrors, classify them before those
+            if isinstance(err, _CONNECT_TIMEOUT_ERRORS):
+                timeout_kind = "connect"
+            elif isinstance(err, _READ_TIMEOUT_ERRORS):
+                timeout_kind = "read"
+            else:
+                timeout_kind = "total"
+            _LOGGER.error("Timeout (%s) fetching %s", timeout_kind, label)
+            raise FingridApiTimeoutError(
+                f"Timeout ({timeout_kind}) fetching {label}", timeout_kind
+            ) from err
         except aiohttp.ClientError as err:
-            _LOGGER.error("Network error fetching dataset %s: %s", dataset_id, err)
-            raise FingridApiError(f"Network error fetching dataset {dataset_id}: {err}") from err
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout fetching dataset %s", dataset_id)
-            raise FingridApiError(f"Timeout fetching dataset {dataset_id}") from asyncio.TimeoutError
+            _LOGGER.error("Network error fetching %s: %s", label, err)
+            raise FingridApiError(f"Network error fetching {label}: {err}") from err
+        except ValueError as err:
+            _LOGGER.error("Invalid JSON received for %s: %s", label, err)
+            raise FingridApiError(f"Invalid JSON received for {label}: {err}") from err
         except Exception as err: # Catch any other unexpected error during fetch
-            _LOGGER.exception("Unexpected error fetching dataset %s: %s", dataset_id, err)
-            raise FingridApiError(f"Unexpected error fetching dataset {dataset_id}: {err}") from err
+            _LOGGER.exception("Unexpected error fetching %s: %s", label, err)
+            raise FingridApiError(f"Unexpected error fetching {label}: {err}") from err
 
+    async def _async_fetch_dataset(self, dataset_id: str) -> dict | None:
+        """Fetch a single dataset from the Fingrid API."""
+        if not self._breaker.allow_request():
+            _LOGGER.debug("Circuit open, using last known data for dataset %s", dataset_id)
+            return self._last_good.get(dataset_id)
+
+        api_response = await self._async_api_get(
+            self._urls[dataset_id], _LATEST_ENTRY_PARAMS, f"dataset {dataset_id}"
+        )
+        # Expecting a dict with a 'data' key containing a non-empty list
+        try:
+            latest_entry = api_response["data"][0]
+        except (KeyError, IndexError, TypeError):
+            _LOGGER.warning("No data or unexpected format for dataset %s: %s", dataset_id, api_response)
+            return None
+        self._last_good[dataset_id] = latest_entry
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Successfully fetched dataset %s: %s", dataset_id, latest_entry)
+        return latest_entry
+
+    async def _async_fetch_all(self, ids: tuple[str, ...]) -> dict[str, dict]:
+        """Fetch the latest entry of several datasets with a single API call."""
+        # The multi-dataset endpoint takes a comma separated id list and returns
+        # the entries of all datasets in one page, newest first.
+        params = {
+            "datasets": ",".join(ids),
+            "pageSize": len(ids),
+            "sortBy": "startTime",
+            "sortOrder": "desc",
+        }
+
+        if not self._breaker.allow_request():
+            _LOGGER.debug("Circuit open, using last known data for datasets %s", ids)
+            return {ds: self._last_good[ds] for ds in ids if ds in self._last_good}
+
+        api_response = await self._async_api_get(
+            FINGRID_MULTI_DATASET_URL, params, f"datasets {params['datasets']}"
+        )
+        if not isinstance(api_response, dict) or not isinstance(api_response.get("data"), list):
+            _LOGGER.warning("Unexpected format for batched datasets %s: %s", ids, api_response)
+            return {}
+
+        # Entries are sorted newest first, so the first one seen per dataset is the latest
+        latest_entries: dict[str, dict] = {}
+        for entry in api_response["data"]:
+            if isinstance(entry, dict) and "datasetId" in entry:
+                latest_entries.setdefault(str(entry["datasetId"]), entry)
+        self._last_good.update(latest_entries)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Successfully fetched batched datasets: %s", latest_entries)
+        return latest_entries
 
     async def _async_update_data(self) -> dict[str, dict | None]:
+        """Fetch data, sharing the result with callers that overlap a running refresh."""
+        if self._inflight is None or self._inflight.done():
+            # Run the fetch as its own task so cancelling one caller, including the
+            # one that started it, doesn't cancel the refresh for the others.
+            self._inflight = self.hass.async_create_task(self._async_fetch_update_data())
+            self._inflight.add_done_callback(self._async_inflight_done)
+        return await asyncio.shield(self._inflight)
+
+    @callback
+    def _async_inflight_done(self, task: asyncio.Task[dict[str, dict | None]]) -> None:
+        """Forget a finished refresh task."""
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled
+            task.exception()
+        if self._inflight is task:
+            self._inflight = None
+
+    async def _async_fetch_update_data(self) -> dict[str, dict | None]:
         """Fetch data from Fingrid API for enabled datasets."""
         data_results: dict[str, dict | None] = {}
-        
-        # Warn if polling interval is too short for Fingrid API limits
-        if self.update_interval.total_seconds() < 180:
-            _LOGGER.warning(
-                "Polling interval is set to less than 3 minutes. This may cause API rate limiting. "
-                "Increase the update interval in integration options."
-            )
 
-        # Fetch datasets sequentially with a delay to avoid rate limits
-        data_results: dict[str, dict | None] = {}
-        auth_failure_raised = False
-        for dataset_id in self.enabled_dataset_ids:
-            try:
-                result = await self._async_fetch_dataset(dataset_id)
-            except FingridApiAuthError as e:
-                _LOGGER.error("Authentication error processing dataset %s: %s", dataset_id, e)
-                if not auth_failure_raised:
-                    raise ConfigEntryAuthFailed(e) from e
-                auth_failure_raised = True
-                data_results[dataset_id] = None
-            except (FingridApiRateLimitError, FingridApiError) as e:
-                _LOGGER.warning("API error processing dataset %s: %s", dataset_id, e)
-                data_results[dataset_id] = None
-            except Exception as e:
-                _LOGGER.error("Unexpected exception for dataset %s during fetch: %s", dataset_id, e)
-                data_results[dataset_id] = None
-            else:
-                if result is not None:
-                    data_results[dataset_id] = result
-                else:
-                    _LOGGER.warning("No data returned or malformed for dataset %s after fetch.", dataset_id)
-                    data_results[dataset_id] = None
-            # Delay between requests to avoid hitting rate limits (10/minute allowed)
-            await asyncio.sleep(7)
+        if not self.enabled_dataset_ids:
+            return data_results
 
+        last_error: Exception | None = None
+
+        # Fetch all enabled datasets with one batched request first
+        try:
+            batched = await self._async_fetch_all(self.enabled_dataset_ids)
+        except FingridApiAuthError as err:
+            # This will trigger re-auth flow in Home Assistant
+            raise ConfigEntryAuthFailed(err) from err
+        except FingridApiRateLimitError as err:
+            # Retrying per dataset would only burn more of the rate limit budget
+            raise UpdateFailed(f"Rate limit hit while fetching Fingrid data: {err}") from err
+        except FingridApiError as err:
+            _LOGGER.warning("Batched fetch failed, falling back to per-dataset requests: %s", err)
+            last_error = err
+            batched = {}
+
+        # The batched page may not contain every dataset (e.g. rarely updated ones),
+        # fetch the missing ones individually and concurrently.
+        missing_ids = [ds for ds in self.enabled_dataset_ids if ds not in batched]
+        results = await asyncio.gather(
+            *(self._async_fetch_dataset(dataset_id) for dataset_id in missing_ids),
+            return_exceptions=True,
+        )
+        fetched = dict(zip(missing_ids, results))
+
+        for dataset_id in self.enabled_dataset_ids:
+            result = batched[dataset_id] if dataset_id in batched else fetched[dataset_id]
             if isinstance(result, FingridApiAuthError):
                 _LOGGER.error("Authentication error processing dataset %s: %s", dataset_id, result)
-                if not auth_failure_raised:
-                     # This will trigger re-auth flow in Home Assistant
-                    raise ConfigEntryAuthFailed(result) from result
-                auth_failure_raised = True
-                data_results[dataset_id] = None 
-            elif isinstance(result, (FingridApiRateLimitError, FingridApiError)):
+                # This will trigger re-auth flow in Home Assistant
+                raise ConfigEntryAuthFailed(result) from result
+            if isinstance(result, (FingridApiRateLimitError, FingridApiError)):
                 _LOGGER.warning("API error processing dataset %s: %s", dataset_id, result)
                 # For rate limit or other API errors, we might still return partial data
                 # or raise UpdateFailed if all fail.
+                last_error = result
                 data_results[dataset_id] = None
             elif isinstance(result, Exception): # Other unexpected exceptions from gather
                 _LOGGER.error("Unexpected exception for dataset %s during gather: %s", dataset_id, result)
+                last_error = result
                 data_results[dataset_id] = None
             elif result is not None:
                 data_results[dataset_id] = result
@@ -173,12 +404,12 @@ class FingridDataUpdateCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("No data returned or malformed for dataset %s after fetch.", dataset_id)
                 data_results[dataset_id] = None
         
-        if not data_results and self.enabled_dataset_ids: # No data fetched at all for enabled sensors
-            # If an auth error already raised ConfigEntryAuthFailed, HA handles it.
-            # Otherwise, if all fetches failed for other reasons:
-            if not auth_failure_raised:
-                last_error = results[-1] if results and isinstance(results[-1], Exception) else "Unknown error"
-                raise UpdateFailed(f"Failed to fetch any data from Fingrid API. Last error: {last_error}")
+        if all(value is None for value in data_results.values()):
+            # No data fetched at all for enabled sensors
+            raise UpdateFailed(
+                f"Failed to fetch any data from Fingrid API. Last error: {last_error or 'Unknown error'}"
+            )
         
-        _LOGGER.debug("Coordinator update finished, data: %s", data_results)
-        return data_results
\ No newline at end of file
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Coordinator update finished, data: %s", data_results)
+        return data_results
@@ -12,4 +12,12 @@ class FingridApiRateLimitError(FingridApiClientError):
     """Exception for Fingrid API rate limit errors (429)."""
 
 class FingridApiError(FingridApiClientError):
-    """Exception for other Fingrid API errors."""
\ No newline at end of file
+    """Exception for other Fingrid API errors."""
+
+class FingridApiTimeoutError(FingridApiError):
+    """Exception for Fingrid API request timeouts."""
+
+    def __init__(self, message: str, timeout_kind: str) -> None:
+        """Initialize with the kind of timeout hit ("connect", "read" or "total")."""
+        super().__init__(message)
+        self.timeout_kind = timeout_kind
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""Helper functions for the Fingrid Easy Setup integration."""
+import hashlib
+
+
+def api_key_unique_id(api_key: str) -> str:
+    """Return the config entry unique_id for an API key without exposing the key."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -22,6 +24,9 @@ from .const import (
     DATASET_ID_POWER_SYSTEM_STATE,
     DATASET_ID_GRID_FREQUENCY, # Add this
     DATASET_ID_ELECTRICITY_SHORTAGE_STATUS, # Add this
+    SENSOR_NAME_POWER_SYSTEM_STATE,
+    SENSOR_NAME_GRID_FREQUENCY,
+    SENSOR_NAME_ELECTRICITY_SHORTAGE_STATUS,
 )
 from .coordinator import FingridDataUpdateCoordinator
 
@@ -48,9 +53,98 @@ ELECTRICITY_SHORTAGE_STATUS_MAP: dict[int, str] = {
 }
 ELECTRICITY_SHORTAGE_STATUS_UNKNOWN = "Unknown"
 
+# Dense lookup tables indexed by the raw value, derived from the maps above.
+# The maps are kept as the public definition of the states.
+POWER_SYSTEM_STATE_TABLE: tuple[str, ...] = tuple(
+    POWER_SYSTEM_STATE_MAP.get(value, POWER_SYSTEM_STATE_UNKNOWN)
+    for value in range(max(POWER_SYSTEM_STATE_MAP) + 1)
+)
+ELECTRICITY_SHORTAGE_STATUS_TABLE: tuple[str, ...] = tuple(
+    ELECTRICITY_SHORTAGE_STATUS_MAP.get(value, ELECTRICITY_SHORTAGE_STATUS_UNKNOWN)
+    for value in range(max(ELECTRICITY_SHORTAGE_STATUS_MAP) + 1)
+)
+
+
+# Entity descriptions are static per dataset, build them once
+POWER_SYSTEM_STATE_DESCRIPTION = SensorEntityDescription(
+    key=DATASET_ID_POWER_SYSTEM_STATE, # Use dataset_id as key
+    name=SENSOR_NAME_POWER_SYSTEM_STATE, # User-friendly name part
+    icon="mdi:transmission-tower",
+    # No device_class or unit_of_measurement for this categorical sensor
+    # state_class can be None if it's not a numeric measurement
+)
+GRID_FREQUENCY_DESCRIPTION = SensorEntityDescription(
+    key=DATASET_ID_GRID_FREQUENCY,
+    name=SENSOR_NAME_GRID_FREQUENCY,
+    icon="mdi:sine-wave",
+    native_unit_of_measurement=UnitOfFrequency.HERTZ,
+    device_class=SensorDeviceClass.FREQUENCY,
+    state_class=SensorStateClass.MEASUREMENT,
+)
+ELECTRICITY_SHORTAGE_STATUS_DESCRIPTION = SensorEntityDescription(
+    key=DATASET_ID_ELECTRICITY_SHORTAGE_STATUS,
+    name=SENSOR_NAME_ELECTRICITY_SHORTAGE_STATUS,
+    icon="mdi:power-plug-off-outline", # Consider dynamic icon later if desired
+)
+
+# Sensors supported by this platform, keyed by dataset ID:
+# dataset_id -> (entity description, value label table or None, unknown label)
+SENSOR_SPECS: dict[
+    str, tuple[SensorEntityDescription, tuple[str, ...] | None, str]
+] = {
+    DATASET_ID_POWER_SYSTEM_STATE: (
+        POWER_SYSTEM_STATE_DESCRIPTION,
+        POWER_SYSTEM_STATE_TABLE,
+        POWER_SYSTEM_STATE_UNKNOWN,
+    ),
+    DATASET_ID_GRID_FREQUENCY: (
+        GRID_FREQUENCY_DESCRIPTION,
+        None,
+        "Unknown",
+    ),
+    DATASET_ID_ELECTRICITY_SHORTAGE_STATUS: (
+        ELECTRICITY_SHORTAGE_STATUS_DESCRIPTION,
+        ELECTRICITY_SHORTAGE_STATUS_TABLE,
+        ELECTRICITY_SHORTAGE_STATUS_UNKNOWN,
+    ),
+}
+
+
+def _resolve_raw(sensor: FingridSensor, current_value: Any) -> None:
+    """Use the dataset value as the sensor state."""
+    sensor._attr_native_value = current_value
+
+
+def _resolve_mapped(sensor: FingridSensor, current_value: Any) -> None:
+    """Use the label of the dataset value as the sensor state."""
+    # Set the mapped description as the state, not the raw number.
+    # The API always sends a number, so convert first and treat failure as unknown.
+    try:
+        numeric_value = int(current_value)
+    except (TypeError, ValueError, OverflowError):
+        sensor._attr_native_value = sensor._unknown_label
+        return
+    value_map = sensor._value_map
+    sensor._attr_native_value = (
+        value_map[numeric_value]
+        if 0 <= numeric_value < len(value_map)
+        else sensor._unknown_label
+    )
+    sensor._attr_extra_state_attributes["raw_value"] = numeric_value
+
 
 class FingridSensor(CoordinatorEntity[FingridDataUpdateCoordinator], SensorEntity):
-    """Base class for Fingrid sensors."""
+    """Sensor for a single Fingrid dataset."""
+
+    # The Home Assistant base classes keep their __dict__, only our own fields are slotted
+    __slots__ = (
+        "_dataset_id",
+        "_config_entry_id",
+        "_value_map",
+        "_unknown_label",
+        "_resolver",
+        "_last_written_state",
+    )
 
     _attr_has_entity_name = True
 
@@ -60,44 +154,68 @@ class FingridSensor(CoordinatorEntity[FingridDataUpdateCoordinator], SensorEntit
         config_entry_id: str,
         dataset_id: str,
         description: SensorEntityDescription,
+        device_info: DeviceInfo,
+        value_map: tuple[str, ...] | None = None,
+        unknown_label: str = "Unknown",
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._dataset_id = dataset_id
+        # Interned so dict probes against the coordinator data can match by identity
+        self._dataset_id = sys.intern(dataset_id)
         self._config_entry_id = config_entry_id # To make unique_id truly unique per config entry
+        # Labels indexed by raw value for categorical datasets, None for numeric ones
+        self._value_map = value_map
+        self._unknown_label = unknown_label
+        # Plain function picked once here instead of branching on every update
+        self._resolver: Callable[[FingridSensor, Any], None] = (
+            _resolve_raw if value_map is None else _resolve_mapped
+        )
+        self._attr_extra_state_attributes: dict[str, Any] = {} # Updated in place
+        # State last written to Home Assistant, used to skip redundant writes
+        self._last_written_state: tuple[Any, ...] | None = None
+
+        self._attr_available = self._compute_available()
 
         # Set unique ID based on config entry ID and dataset ID
         self._attr_unique_id = f"{self._config_entry_id}_{self._dataset_id}"
 
-        # Associate with a device for better organization in HA
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._config_entry_id)},
-            name="Fingrid Open Data", # User-friendly name for the device
-            manufacturer="Fingrid",
-            model="API Data", # Can be more specific if versions/types emerge
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        # Associate with a device for better organization in HA (shared per config entry)
+        self._attr_device_info = device_info
 
-    @property
-    def available(self) -> bool:
+    def _compute_available(self) -> bool:
         """Return True if coordinator is available and dataset has data."""
+        data = self.coordinator.data
         return (
             super().available
-            and self.coordinator.data is not None
-            and self._dataset_id in self.coordinator.data
-            and self.coordinator.data[self._dataset_id] is not None
+            and data is not None
+            and data.get(self._dataset_id) is not None
         )
 
+    @property
+    def available(self) -> bool:
+        """Return the availability computed on the last coordinator update."""
+        # CoordinatorEntity overrides available, so it has to be overridden again
+        # to serve the cached value instead of recomputing it on every state read.
+        return self._attr_available
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data and self._dataset_id in self.coordinator.data:
+        self._attr_available = self._compute_available()
+        # Unavailable means the dataset is missing from the data; the coordinator has
+        # already logged why, so only the availability change below needs writing.
+        if self._attr_available:
             dataset_data = self.coordinator.data[self._dataset_id]
-            if dataset_data and "value" in dataset_data:
-                self._update_state(dataset_data)
-            else:
-                # Mark as unavailable if specific data point is missing after successful fetch
+            current_value = dataset_data.get("value")
+            if current_value is not None:
+                self._resolver(self, current_value)
+                # Store the raw API timestamp if available. Fingrid uses 'endTime' for
+                # the data point's timestamp, or startTime as a fallback.
+                api_timestamp = dataset_data.get("endTime") or dataset_data.get("startTime")
+                if api_timestamp is not None:
+                    self._attr_extra_state_attributes["api_timestamp"] = api_timestamp
+            elif _LOGGER.isEnabledFor(logging.WARNING):
                 # This case might indicate an unexpected API response structure for this sensor
                 _LOGGER.warning(
                     "Dataset %s for entity %s has no 'value' or is None. Data: %s",
@@ -105,113 +223,18 @@ class FingridSensor(CoordinatorEntity[FingridDataUpdateCoordinator], SensorEntit
                     self.entity_id,
                     dataset_data
                 )
-                # Keep previous state or set to None? For now, let super().available handle it.
-                # If we want to force unavailable if 'value' is missing:
-                # self._attr_native_value = None
-        self.async_write_ha_state()
-
-    def _update_state(self, dataset_data: dict[str, Any]) -> None:
-        """Update the sensor's state from dataset data. To be overridden by subclasses."""
-        self._attr_native_value = dataset_data.get("value")
-        # Store the raw API timestamp if available
-        if "endTime" in dataset_data: # Fingrid uses 'endTime' for the data point's timestamp
-             self._attr_extra_state_attributes = {
-                 **self._attr_extra_state_attributes, # preserve existing attributes
-                "api_timestamp": dataset_data["endTime"],
-             }
-        elif "startTime" in dataset_data: # Or startTime as a fallback
-             self._attr_extra_state_attributes = {
-                 **self._attr_extra_state_attributes,
-                "api_timestamp": dataset_data["startTime"],
-             }
-
-
-class FingridPowerSystemStateSensor(FingridSensor):
-    """Sensor for Fingrid Power System State (Dataset 209)."""
-
-    def __init__(
-        self,
-        coordinator: FingridDataUpdateCoordinator,
-        config_entry_id: str,
-        dataset_id: str, # Should be "209"
-    ) -> None:
-        """Initialize the power system state sensor."""
-        description = SensorEntityDescription(
-            key=dataset_id, # Use dataset_id as key
-            name="Power System State", # User-friendly name part
-            icon="mdi:transmission-tower",
-            # No device_class or unit_of_measurement for this categorical sensor
-            # state_class can be None if it's not a numeric measurement
-        )
-        super().__init__(coordinator, config_entry_id, dataset_id, description)
-        self._attr_extra_state_attributes = {} # Initialize extra attributes
-
-    def _update_state(self, dataset_data: dict[str, Any]) -> None:
-        """Update the sensor's state and attributes."""
-        # Set the mapped description as the state, not the raw number
-        current_value = dataset_data.get("value")
-        if isinstance(current_value, (int, float)):
-            numeric_value = int(current_value)
-            description = POWER_SYSTEM_STATE_MAP.get(numeric_value, POWER_SYSTEM_STATE_UNKNOWN)
-            self._attr_native_value = description
-            self._attr_extra_state_attributes["raw_value"] = numeric_value
-        else:
-            self._attr_native_value = POWER_SYSTEM_STATE_UNKNOWN
-
-
-class FingridGridFrequencySensor(FingridSensor):
-    """Sensor for Fingrid Grid Frequency (Dataset 177)."""
 
-    def __init__(
-        self,
-        coordinator: FingridDataUpdateCoordinator,
-        config_entry_id: str,
-        dataset_id: str, # Should be DATASET_ID_GRID_FREQUENCY
-    ) -> None:
-        """Initialize the grid frequency sensor."""
-        description = SensorEntityDescription(
-            key=dataset_id,
-            name="Grid Frequency", # From SENSOR_NAME_GRID_FREQUENCY in const.py
-            icon="mdi:sine-wave",
-            native_unit_of_measurement=UnitOfFrequency.HERTZ,
-            device_class=SensorDeviceClass.FREQUENCY,
-            state_class=SensorStateClass.MEASUREMENT,
-        )
-        super().__init__(coordinator, config_entry_id, dataset_id, description)
-        self._attr_extra_state_attributes = {} # Initialize
-
-
-class FingridElectricityShortageSensor(FingridSensor):
-    """Sensor for Fingrid Electricity Shortage Status (Dataset 336)."""
-
-    def __init__(
-        self,
-        coordinator: FingridDataUpdateCoordinator,
-        config_entry_id: str,
-        dataset_id: str, # Should be DATASET_ID_ELECTRICITY_SHORTAGE_STATUS
-    ) -> None:
-        """Initialize the electricity shortage status sensor."""
-        description = SensorEntityDescription(
-            key=dataset_id,
-            name="Electricity Shortage Status", # From SENSOR_NAME_ELECTRICITY_SHORTAGE_STATUS
-            icon="mdi:power-plug-off-outline", # Consider dynamic icon later if desired
+        # Only write the state if something visible changed, e.g. another dataset
+        # changing doesn't rewrite this sensor's unchanged state.
+        written_state = (
+            self._attr_available,
+            self._attr_native_value,
+            self._attr_extra_state_attributes.get("raw_value"),
+            self._attr_extra_state_attributes.get("api_timestamp"),
         )
-        super().__init__(coordinator, config_entry_id, dataset_id, description)
-        self._attr_extra_state_attributes = {} # Initialize
-
-    def _update_state(self, dataset_data: dict[str, Any]) -> None:
-        """Update the sensor's state and attributes."""
-        # Set the mapped description as the state, not the raw number
-        current_value = dataset_data.get("value")
-        if isinstance(current_value, (int, float)):
-            numeric_value = int(current_value)
-            description_text = ELECTRICITY_SHORTAGE_STATUS_MAP.get(
-                numeric_value, ELECTRICITY_SHORTAGE_STATUS_UNKNOWN
-            )
-            self._attr_native_value = description_text
-            self._attr_extra_state_attributes["raw_value"] = numeric_value
-        else:
-            self._attr_native_value = ELECTRICITY_SHORTAGE_STATUS_UNKNOWN
+        if written_state != self._last_written_state:
+            self._last_written_state = written_state
+            self.async_write_ha_state()
 
 
 async def async_setup_entry(
@@ -224,51 +247,43 @@ async def async_setup_entry(
 
     entities_to_add: list[SensorEntity] = []
 
+    # All sensors of the entry belong to the same device, build its info once
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Fingrid Open Data", # User-friendly name for the device
+        manufacturer="Fingrid",
+        model="API Data", # Can be more specific if versions/types emerge
+        entry_type=DeviceEntryType.SERVICE,
+    )
+
     # Get enabled datasets from the coordinator (which gets them from options)
     enabled_datasets = coordinator.enabled_dataset_ids
-    _LOGGER.debug("Setting up sensors for enabled datasets: %s", enabled_datasets)
-
-    if DATASET_ID_POWER_SYSTEM_STATE in enabled_datasets:
-        entities_to_add.append(
-            FingridPowerSystemStateSensor(
-                coordinator=coordinator,
-                config_entry_id=entry.entry_id,
-                dataset_id=DATASET_ID_POWER_SYSTEM_STATE,
-            )
-        )
-        _LOGGER.info(
-            "Adding Fingrid Power System State sensor (%s)",
-            DATASET_ID_POWER_SYSTEM_STATE
-        )
-
-    # Add new sensors:
-    if DATASET_ID_GRID_FREQUENCY in enabled_datasets:
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Setting up sensors for enabled datasets: %s", enabled_datasets)
+
+    # Checked once per setup rather than at import, so runtime level changes apply
+    log_added = _LOGGER.isEnabledFor(logging.INFO)
+    for dataset_id in enabled_datasets:
+        spec = SENSOR_SPECS.get(dataset_id)
+        if spec is None:
+            _LOGGER.warning("Ignoring unsupported Fingrid dataset %s in options", dataset_id)
+            continue
+        description, value_map, unknown_label = spec
         entities_to_add.append(
-            FingridGridFrequencySensor(
+            FingridSensor(
                 coordinator=coordinator,
                 config_entry_id=entry.entry_id,
-                dataset_id=DATASET_ID_GRID_FREQUENCY,
+                dataset_id=dataset_id,
+                description=description,
+                device_info=device_info,
+                value_map=value_map,
+                unknown_label=unknown_label,
             )
         )
-        _LOGGER.info(
-            "Adding Fingrid Grid Frequency sensor (%s)",
-            DATASET_ID_GRID_FREQUENCY
-        )
-
-    if DATASET_ID_ELECTRICITY_SHORTAGE_STATUS in enabled_datasets:
-        entities_to_add.append(
-            FingridElectricityShortageSensor(
-                coordinator=coordinator,
-                config_entry_id=entry.entry_id,
-                dataset_id=DATASET_ID_ELECTRICITY_SHORTAGE_STATUS,
-            )
-        )
-        _LOGGER.info(
-            "Adding Fingrid Electricity Shortage Status sensor (%s)",
-            DATASET_ID_ELECTRICITY_SHORTAGE_STATUS
-        )
+        if log_added:
+            _LOGGER.info("Adding Fingrid %s sensor (%s)", description.name, dataset_id)
 
     if entities_to_add:
         async_add_entities(entities_to_add)
     else:
-        _LOGGER.info("No Fingrid sensors currently enabled via options to set up.")
\ No newline at end of file
+        _LOGGER.info("No Fingrid sensors currently enabled via options to set up.")